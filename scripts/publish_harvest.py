@@ -6,6 +6,7 @@ assign verdicts, and publish as structured JSON + readable Markdown.
 Usage:
     python3 publish_harvest.py                  # today
     python3 publish_harvest.py --date 2026-02-25  # specific date
+    python3 publish_harvest.py --rebuild-csv     # re-sort the cumulative CSV
 
 Reads from:
     briefing/cache/overseas/briefing_data_{date}.json
@@ -19,12 +20,37 @@ Outputs to:
 """
 
 import csv
+import hashlib
+import heapq
 import json
+import mmap
 import os
+import pickle
 import re
 import sys
+import xml.etree.ElementTree as ET
+from collections import Counter
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from xml.sax.saxutils import escape as xml_escape
+from functools import lru_cache
+from operator import itemgetter
+
+# orjson (Rust, simdjson-style vectorized parser) is several times faster than
+# stdlib json on the multi-MB cache parse and the indented dumps. Optional:
+# fall back to stdlib so the script still runs where the wheel isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson streams the cache instead of materializing the full dict — peak memory
+# stays near one article at a time, and non-tier keys are never built. Also
+# optional; picks its fastest (yajl2 C) backend automatically when installed.
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Paths — resolve relative to script location
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -45,85 +71,268 @@ VERDICT_LABELS = {
 
 VERDICT_ORDER = ["must_read", "worth_reading", "neutral", "overhyped"]
 
+# Tier keys holding article lists in the briefing cache
+CACHE_TIERS = ("tier1", "tier2", "tier3", "hn")
+
+
+def json_loads(buf):
+    """Parse JSON from a str/bytes buffer with the fastest available backend."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def json_dumps(obj):
+    """Serialize one object to a compact UTF-8 JSON string (for JSONL lines)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def write_json(obj, path):
+    """Serialize obj as indented UTF-8 JSON to path in a single write.
+
+    Serializes to a sidecar and swaps it in, so a failure mid-dump (an
+    unserializable value, a full disk) never truncates an existing file.
+    """
+    tmp_path = path + ".tmp"
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(obj, ensure_ascii=False, indent=2))
+    os.replace(tmp_path, path)
+
+
+def _cache_mtime(channel, date_str):
+    """mtime of one channel's briefing cache, 0.0 when it's missing."""
+    path = os.path.join(CACHE_DIR, channel, f"briefing_data_{date_str}.json")
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
 
 def load_cache(channel, date_str):
     """Load ODS cache for a channel and date."""
     path = os.path.join(CACHE_DIR, channel, f"briefing_data_{date_str}.json")
-    if not os.path.exists(path):
+    # EAFP: a failed open costs one syscall instead of the stat + open pair;
+    # the large buffer keeps the parse from issuing many small reads.
+    try:
+        f = open(path, "rb", buffering=1 << 20)
+    except FileNotFoundError:
         print(f"  [skip] {path} not found")
         return []
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
     articles = []
-    for tier_key in ["tier1", "tier2", "tier3", "hn"]:
+    with f:
+        if orjson is None and ijson is not None:
+            # Low-memory fallback when the fast parser is absent: one
+            # streaming pass over the top-level object, keeping only the
+            # tier arrays and never building the enclosing cache dict.
+            tiers = {}
+            # use_float: ijson otherwise yields decimal.Decimal for
+            # non-integer numbers, which stdlib json (the only dumper on
+            # this path) refuses to serialize downstream
+            for key, value in ijson.kvitems(f, "", use_float=True):
+                if key in CACHE_TIERS:
+                    tiers[key] = value
+            for tier_key in CACHE_TIERS:
+                articles.extend(tiers.get(tier_key, ()))
+            return articles
+        if orjson is not None:
+            # mmap lets orjson scan straight out of the page cache instead of
+            # first copying the whole file into a bytes object.
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                return []
+            try:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                view = memoryview(mm)
+                try:
+                    data = orjson.loads(view)
+                finally:
+                    view.release()
+            finally:
+                mm.close()
+        else:
+            data = json.loads(f.read())
+    for tier_key in CACHE_TIERS:
         articles.extend(data.get(tier_key, []))
     return articles
 
 
-def assign_verdict(article):
-    """Assign verdict based on scoring dimensions. Returns verdict string."""
-    score = article.get("score", 0)
-    novelty = article.get("novelty", 0)
-    depth = article.get("depth", 0)
-    actionability = article.get("actionability", 0)
-    credibility = article.get("credibility", 0)
+def ingest_channel(channel, date_str):
+    """Load, filter, and clean one channel. Returns (cleaned, raw_count)."""
+    raw = load_cache(channel, date_str)
+    cleaned = []
+    for a in raw:
+        if a.get("rejected"):
+            continue
+        if a.get("score", 0) < 60:
+            continue
+        cleaned.append(clean_article(a, channel))
+    return cleaned, len(raw)
+
+
+@dataclass(slots=True)
+class Scoring:
+    """Internal scoring dimensions for one article. Compact slots layout —
+    no per-article dict hash table — and never published."""
+
+    score: int
+    novelty: int
+    depth: int
+    actionability: int
+    credibility: int
+
+# Base score→verdict table: 85+ is must_read, everything else neutral.
+# The dimension-based overrides only apply in the 70–84 band, so the common
+# case is one clamp, one range check, and one table load.
+_VERDICT_BASE = ["neutral"] * 101
+for _s in range(85, 101):
+    _VERDICT_BASE[_s] = "must_read"
+del _s
+
+
+def assign_verdict(scoring):
+    """Assign verdict from a Scoring. Returns verdict string."""
+    s = scoring.score
+    # int() also tolerates float scores from hand-edited caches — the table
+    # index would raise on them where the old comparisons did not
+    s = 0 if s < 0 else (100 if s > 100 else int(s))
+    if 70 <= s < 85:
+        if scoring.novelty >= 2 or scoring.depth >= 2 or scoring.actionability >= 2:
+            return "worth_reading"
+        if scoring.novelty == 0 and scoring.credibility <= 1:
+            return "overhyped"
+    return _VERDICT_BASE[s]
+
+
+def render_md_block(a):
+    """Render one article's Markdown digest block (ends with a --- rule)."""
+    title = a["title"]
+    title_display = title[:80] + "…" if len(title) > 80 else title
+    parts = [
+        f"### [{title_display}]({a['link']}) — {a['score']}/100\n"
+        f"**{a['source']}** · {a['category']} · {a['level']}\n"
+        f"> {a['summary']}\n\n"
+    ]
+    core_point = a["core_point"]
+    if core_point:
+        # Strip internal annotations that may leak from source data
+        core_point_clean = core_point.replace("疑似PR稿。", "").replace("疑似 PR 稿。", "").replace("疑似PR稿", "").replace("疑似 PR 稿", "").strip()
+        if core_point_clean:
+            parts.append(f"{core_point_clean}\n")
+        parts.append("\n")
+    if a["highlights"]:
+        parts.append("".join(f"- {h}\n" for h in a["highlights"]))
+        parts.append("\n")
+    if a["why_matters"]:
+        parts.append(f"**Why it matters:** {a['why_matters']}\n\n")
+    parts.append("---\n\n")
+    return "".join(parts)
+
+
+# Field defaults backfilled before the batched fetch in clean_article.
+# The highlights default is a tuple (immutable) so sharing it is safe.
+_ODS_DEFAULTS = {
+    "title": "",
+    "link": "",
+    "source": "",
+    "category": "",
+    "pub_date": "",
+    "summary": "",
+    "core_point": "",
+    "highlights": (),
+    "why_matters": "",
+    "level": "",
+    "score": 0,
+    "novelty": 0,
+    "depth": 0,
+    "actionability": 0,
+    "credibility": 0,
+}
+
+# Fetches all fields in one C call, in _ODS_DEFAULTS key order
+_ODS_FIELDS = itemgetter(*_ODS_DEFAULTS)
+
 
-    if score >= 85:
-        return "must_read"
-    if score >= 70 and (novelty >= 2 or depth >= 2 or actionability >= 2):
-        return "worth_reading"
-    if score >= 70 and novelty == 0 and credibility <= 1:
-        return "overhyped"
-    return "neutral"
+def public_fields(article):
+    """Article dict without derived cache fields (underscore-prefixed)."""
+    return {k: v for k, v in article.items() if not k.startswith("_")}
 
 
 def clean_article(article, channel):
     """Extract public fields from an ODS article. No scoring dimensions exposed."""
-    verdict = assign_verdict(article)
-    return {
-        "title": article.get("title", ""),
-        "link": article.get("link", ""),
-        "source": article.get("source", ""),
+    # One merged dict + one itemgetter call replaces ~15 separate
+    # .get(key, default) probes per article.
+    merged = {**_ODS_DEFAULTS, **article}
+    (
+        title, link, source, category, pub_date, summary, core_point,
+        highlights, why_matters, level,
+        score, novelty, depth, actionability, credibility,
+    ) = _ODS_FIELDS(merged)
+    scoring = Scoring(score, novelty, depth, actionability, credibility)
+    verdict = assign_verdict(scoring)
+    cleaned = {
+        "title": title,
+        "link": link,
+        "source": source,
         "source_channel": channel,
-        "category": article.get("category", ""),
-        "pub_date": article.get("pub_date", ""),
-        "summary": article.get("summary", ""),
-        "core_point": article.get("core_point", ""),
-        "highlights": article.get("highlights", []),
-        "why_matters": article.get("why_matters", ""),
-        "score": article.get("score", 0),
-        "level": article.get("level", ""),
+        "category": category,
+        "pub_date": pub_date,
+        "summary": summary,
+        "core_point": core_point,
+        "highlights": highlights,
+        "why_matters": why_matters,
+        "score": score,
+        "level": level,
         "verdict": verdict,
     }
+    # All digest fields are fixed from here on, so render the article's
+    # Markdown block once now instead of re-formatting it per output pass.
+    cleaned["_md_block"] = render_md_block(cleaned)
+    cleaned["_title_short"] = title if len(title) <= 60 else title[:60] + "..."
+    return cleaned
 
 
-def generate_json(articles, date_str):
-    """Write structured JSON output."""
-    sorted_articles = sorted(articles, key=lambda x: x["score"], reverse=True)
-    verdict_counts = {}
-    for a in sorted_articles:
-        v = a["verdict"]
-        verdict_counts[v] = verdict_counts.get(v, 0) + 1
-
+def generate_json(articles, verdict_counts, date_str):
+    """Write structured JSON output. Articles arrive score-sorted from main()."""
     output = {
         "date": date_str,
-        "total": len(sorted_articles),
+        "total": len(articles),
         "verdict_counts": verdict_counts,
-        "articles": sorted_articles,
+        "articles": [public_fields(a) for a in articles],
     }
     path = os.path.join(HARVEST_DIR, "api", f"{date_str}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    write_json(output, path)
+
+    # Maintain the date → {total, must_read} sidecar so the README
+    # generator reads one small index instead of re-parsing every daily file
+    idx_path = os.path.join(HARVEST_DIR, "api", "index.json")
+    try:
+        with open(idx_path, "rb") as f:
+            idx = json_loads(f.read())
+    except (OSError, ValueError):
+        idx = {}
+    idx[date_str] = {
+        "total": len(articles),
+        "must_read": verdict_counts.get("must_read", 0),
+    }
+    write_json(idx, idx_path)
+
     print(f"  [ok] {path} ({len(articles)} articles)")
     return path
 
 
-def generate_daily_picks(articles, date_str):
+def generate_daily_picks(by_verdict, date_str):
     """Write daily red/black list JSON."""
     picks = {"date": date_str}
     for v in VERDICT_ORDER:
-        group = [a for a in articles if a["verdict"] == v]
-        group.sort(key=lambda x: x["score"], reverse=True)
+        group = by_verdict[v]  # already score-sorted
         picks[v] = [
             {
                 "title": a["title"],
@@ -138,69 +347,113 @@ def generate_daily_picks(articles, date_str):
     lists_dir = os.path.join(HARVEST_DIR, "lists")
     os.makedirs(lists_dir, exist_ok=True)
     path = os.path.join(lists_dir, "daily-picks.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(picks, f, ensure_ascii=False, indent=2)
+    write_json(picks, path)
     print(f"  [ok] {path}")
     return path
 
 
-def update_source_stats(articles, date_str):
-    """Rebuild source stats from JSONL ground truth. Idempotent — safe to re-run."""
+def _fold_article_stats(sources_data, a, date_str):
+    """Fold one article into the per-source running totals.
+
+    Returns the source name folded into, or None if the article had none."""
+    src = a.get("source", "")
+    if not src:
+        return None
+    pub_date = a.get("pub_date", "")
+    s = sources_data.get(src)
+    if s is None:
+        s = sources_data[src] = {
+            "articles_count": 0,
+            "total_score": 0,
+            "must_read_count": 0,
+            "noise_count": 0,
+            "first_seen": pub_date or date_str,
+            "last_seen": pub_date or date_str,
+        }
+    verdict = a.get("verdict")
+    s["articles_count"] += 1
+    s["total_score"] += a.get("score", 0)
+    s["must_read_count"] += verdict == "must_read"
+    s["noise_count"] += verdict == "overhyped"
+    if pub_date:
+        if pub_date < s["first_seen"]:
+            s["first_seen"] = pub_date
+        if pub_date > s["last_seen"]:
+            s["last_seen"] = pub_date
+    return src
+
+
+def update_source_stats(new_articles, date_str):
+    """Update source stats. Normally folds only today's newly appended rows
+    into the existing snapshot (O(today), not O(total)); falls back to a
+    full rebuild from JSONL ground truth when the snapshot is missing,
+    unreadable, or stale — i.e. its row count plus today's rows doesn't
+    match the dedup index — or when new_articles is None. Idempotent — a
+    re-run appends zero new rows, so it folds nothing."""
     sources_dir = os.path.join(HARVEST_DIR, "sources")
     os.makedirs(sources_dir, exist_ok=True)
     stats_path = os.path.join(sources_dir, "source_stats.json")
     jsonl_path = os.path.join(HARVEST_DIR, "datasets", "scored-articles.jsonl")
+    idx_path = os.path.join(HARVEST_DIR, "datasets", "scored-articles.idx")
 
-    sources_data = {}
-
-    # Rebuild from JSONL (single source of truth)
-    if os.path.exists(jsonl_path):
-        with open(jsonl_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    a = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                src = a.get("source", "")
-                if not src:
-                    continue
-                pub_date = a.get("pub_date", "")
-                if src not in sources_data:
-                    sources_data[src] = {
-                        "articles_count": 0,
-                        "total_score": 0,
-                        "must_read_count": 0,
-                        "noise_count": 0,
-                        "first_seen": pub_date or date_str,
-                        "last_seen": pub_date or date_str,
-                    }
-                s = sources_data[src]
-                s["articles_count"] += 1
-                s["total_score"] += a.get("score", 0)
-                if a.get("verdict") == "must_read":
-                    s["must_read_count"] += 1
-                if a.get("verdict") == "overhyped":
-                    s["noise_count"] += 1
-                if pub_date:
-                    if pub_date < s["first_seen"]:
-                        s["first_seen"] = pub_date
-                    if pub_date > s["last_seen"]:
-                        s["last_seen"] = pub_date
-
-    # Compute derived fields
-    for s in sources_data.values():
+    sources_data = None
+    rows_covered = 0
+    if new_articles is not None:
+        try:
+            with open(stats_path, "rb") as f:
+                snap = json_loads(f.read())
+            sources_data = snap.get("sources")
+            rows_covered = snap.get("rows", -1) + len(new_articles)
+            # Staleness guard: once today's rows are folded, the snapshot
+            # must account for every row in the dataset (8 bytes per row in
+            # the dedup index). A mismatch means some earlier run appended
+            # rows but died before the stats step — rebuild instead of
+            # perpetuating the drift.
+            if rows_covered != os.path.getsize(idx_path) // 8:
+                sources_data = None
+        except (OSError, ValueError):
+            sources_data = None
+
+    if sources_data is not None:
+        touched = set()
+        for a in new_articles:
+            src = _fold_article_stats(sources_data, a, date_str)
+            if src:
+                touched.add(src)
+        dirty = [sources_data[src] for src in touched]
+    else:
+        # Rebuild from JSONL (single source of truth) — today's rows are
+        # already appended by the time this runs
+        sources_data = {}
+        rows_covered = 0
+        if os.path.exists(jsonl_path):
+            with open(jsonl_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        a = json_loads(line)
+                    except ValueError:
+                        continue
+                    # Counted only after a successful parse — the dedup
+                    # index likewise holds hashes for parseable rows only,
+                    # and the staleness guard compares the two
+                    rows_covered += 1
+                    _fold_article_stats(sources_data, a, date_str)
+        dirty = sources_data.values()
+
+    # Compute derived fields — only for sources touched this run (a full
+    # rebuild touches all of them)
+    for s in dirty:
         cnt = s["articles_count"]
         if cnt > 0:
             s["avg_score"] = round(s["total_score"] / cnt, 1)
             s["must_read_rate"] = round(s["must_read_count"] / cnt * 100, 1)
             s["noise_rate"] = round(s["noise_count"] / cnt * 100, 1)
 
-    stats = {"sources": sources_data, "updated": date_str}
-    with open(stats_path, "w", encoding="utf-8") as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
+    stats = {"sources": sources_data, "rows": rows_covered, "updated": date_str}
+    write_json(stats, stats_path)
     print(f"  [ok] {stats_path} ({len(sources_data)} sources tracked)")
     return stats_path
 
@@ -225,127 +478,98 @@ def extract_theme(summary, max_len=40):
     return truncated.rstrip("，。；、 ") + "…"
 
 
-def generate_markdown(articles, date_str):
+def generate_markdown(by_verdict, verdict_counts, source_counts, date_str):
     """Write human-readable Markdown, grouped by verdict."""
-    all_sources = set(a["source"] for a in articles)
-
-    # Count verdicts
-    verdict_counts = {}
-    for a in articles:
-        v = a["verdict"]
-        verdict_counts[v] = verdict_counts.get(v, 0) + 1
-
-    lines = []
-    lines.append(f"# AI Daily Harvest — {date_str}")
-    lines.append("")
+    total = sum(verdict_counts.values())
 
-    # Overview section
-    lines.append("## Overview")
-    lines.append("")
+    month_dir = os.path.join(HARVEST_DIR, "digest", date_str[:7])
+    os.makedirs(month_dir, exist_ok=True)
+    path = os.path.join(month_dir, f"{date_str}.md")
 
-    # Compute groups
-    must_reads = sorted(
-        [a for a in articles if a["verdict"] == "must_read"],
-        key=lambda x: x["score"],
-        reverse=True,
-    )
-    # Compute stats
-    verdict_parts = []
-    for v in VERDICT_ORDER:
-        c = verdict_counts.get(v, 0)
-        if c > 0:
-            verdict_parts.append(f"**{c}** {VERDICT_LABELS[v].lower()}")
-    source_counts = {}
-    for a in articles:
-        source_counts[a["source"]] = source_counts.get(a["source"], 0) + 1
-    top_sources = sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-    top_str = " · ".join(f"{name} ({count})" for name, count in top_sources)
-
-    # Thematic digest + stats blockquote
-    MAX_THEMES = 3
-    if must_reads:
-        themes = [extract_theme(a["summary"]) for a in must_reads[:MAX_THEMES]]
-        extra = len(must_reads) - MAX_THEMES
-        digest = " · ".join(themes)
-        if extra > 0:
-            digest += f" (+{extra} more)"
-        lines.append(f"> **Must Read** — {digest}")
-    if must_reads:
-        lines.append(">")
-    lines.append(f"> {len(articles)} articles: {' · '.join(verdict_parts)}")
-    lines.append(">")
-    lines.append(f"> Top sources: {top_str}")
-    lines.append("")
-
-    # Top picks list (must_read articles)
-    if must_reads:
-        for a in must_reads[:5]:
-            title_short = a["title"][:60] + "..." if len(a["title"]) > 60 else a["title"]
-            lines.append(f"- **{a['score']}** [{title_short}]({a['link']}) — {a['source']}")
-        lines.append("")
+    # Stream straight to the file through a 1 MB buffer instead of holding
+    # the whole document in memory first. Writes go through a one-chunk
+    # lookbehind so the final chunk can be trimmed to a single trailing
+    # newline, matching the old buffered writer byte for byte. Write to a
+    # sidecar and swap it in at the end so an exception mid-stream leaves
+    # yesterday's (or an earlier run's) digest intact, never a truncated one.
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        pending = ""
+
+        def w(chunk):
+            nonlocal pending
+            f.write(pending)
+            pending = chunk
+
+        # Overview section
+        w(f"# AI Daily Harvest — {date_str}\n\n## Overview\n\n")
+
+        # Compute groups (buckets arrive score-sorted from main())
+        must_reads = by_verdict["must_read"]
+        # Compute stats
+        verdict_parts = []
+        for v in VERDICT_ORDER:
+            c = verdict_counts.get(v, 0)
+            if c > 0:
+                verdict_parts.append(f"**{c}** {VERDICT_LABELS[v].lower()}")
+        top_sources = source_counts.most_common(3)
+        top_str = " · ".join(f"{name} ({count})" for name, count in top_sources)
+
+        # Thematic digest + stats blockquote
+        MAX_THEMES = 3
+        if must_reads:
+            themes = [extract_theme(a["summary"]) for a in must_reads[:MAX_THEMES]]
+            extra = len(must_reads) - MAX_THEMES
+            digest = " · ".join(themes)
+            if extra > 0:
+                digest += f" (+{extra} more)"
+            w(f"> **Must Read** — {digest}\n>\n")
+        w(f"> {total} articles: {' · '.join(verdict_parts)}\n>\n> Top sources: {top_str}\n\n")
+
+        # Top picks list (must_read articles)
+        if must_reads:
+            w(
+                "".join(
+                    f"- **{a['score']}** [{a['_title_short']}]({a['link']}) — {a['source']}\n"
+                    for a in must_reads[:5]
+                )
+                + "\n"
+            )
 
-    # Group by verdict (skip overhyped from readable output)
-    for verdict in VERDICT_ORDER:
-        if verdict == "overhyped":
-            continue
-        group = [a for a in articles if a["verdict"] == verdict]
-        if not group:
-            continue
-        group.sort(key=lambda x: x["score"], reverse=True)
+        # Group by verdict (skip overhyped from readable output)
+        for verdict in VERDICT_ORDER:
+            if verdict == "overhyped":
+                continue
+            group = by_verdict[verdict]
+            if not group:
+                continue
 
-        label = VERDICT_LABELS[verdict]
-        lines.append(f"## {label}")
-        lines.append("")
+            w(f"## {VERDICT_LABELS[verdict]}\n\n")
 
-        for a in group:
-            title = a["title"]
-            link = a["link"]
-            score = a["score"]
-            source = a["source"]
-            category = a["category"]
-            level = a["level"]
-            summary = a["summary"]
-            core_point = a["core_point"]
-            highlights = a["highlights"]
-            why_matters = a["why_matters"]
-
-            title_display = title[:80] + "…" if len(title) > 80 else title
-            lines.append(f"### [{title_display}]({link}) — {score}/100")
-            lines.append(f"**{source}** · {category} · {level}")
-            lines.append(f"> {summary}")
-            lines.append("")
-            if core_point:
-                # Strip internal annotations that may leak from source data
-                core_point_clean = core_point.replace("疑似PR稿。", "").replace("疑似 PR 稿。", "").replace("疑似PR稿", "").replace("疑似 PR 稿", "").strip()
-                if core_point_clean:
-                    lines.append(f"{core_point_clean}")
-                lines.append("")
-            if highlights:
-                for h in highlights:
-                    lines.append(f"- {h}")
-                lines.append("")
-            if why_matters:
-                lines.append(f"**Why it matters:** {why_matters}")
-                lines.append("")
-            lines.append("---")
-            lines.append("")
+            for a in group:
+                w(a["_md_block"])
 
-    month_dir = os.path.join(HARVEST_DIR, "digest", date_str[:7])
-    os.makedirs(month_dir, exist_ok=True)
-    path = os.path.join(month_dir, f"{date_str}.md")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        f.write(pending.rstrip("\n") + "\n")
+    os.replace(tmp_path, path)
     print(f"  [ok] {path}")
     return path
 
 
-def append_dataset(articles, date_str):
-    """Append today's articles to cumulative JSONL dataset. Idempotent."""
-    datasets_dir = os.path.join(HARVEST_DIR, "datasets")
-    os.makedirs(datasets_dir, exist_ok=True)
-    jsonl_path = os.path.join(datasets_dir, "scored-articles.jsonl")
+def dedup_key_hash(pub_date, title):
+    """8-byte digest of the (pub_date, title) dedup key."""
+    return hashlib.blake2b(
+        f"{pub_date}\x00{title}".encode("utf-8"), digest_size=8
+    ).digest()
+
 
-    # Load existing entries for dedup (date+title)
+def load_dedup_index(idx_path, jsonl_path):
+    """Load the dedup hash set from the sidecar index, rebuilding it from the
+    JSONL (one-shot migration / corrupt-index recovery) when needed."""
+    if os.path.exists(idx_path):
+        with open(idx_path, "rb") as f:
+            blob = f.read()
+        if len(blob) % 8 == 0:
+            return {blob[i:i + 8] for i in range(0, len(blob), 8)}
     existing = set()
     if os.path.exists(jsonl_path):
         with open(jsonl_path, "r", encoding="utf-8") as f:
@@ -354,24 +578,72 @@ def append_dataset(articles, date_str):
                 if not line:
                     continue
                 try:
-                    entry = json.loads(line)
-                    existing.add((entry.get("pub_date", ""), entry.get("title", "")))
-                except json.JSONDecodeError:
+                    entry = json_loads(line)
+                except ValueError:
                     continue
+                existing.add(
+                    dedup_key_hash(entry.get("pub_date", ""), entry.get("title", ""))
+                )
+    with open(idx_path, "wb") as f:
+        f.write(b"".join(existing))
+    return existing
 
-    # Append new articles
-    new_count = 0
-    with open(jsonl_path, "a", encoding="utf-8") as f:
-        for a in sorted(articles, key=lambda x: x["score"], reverse=True):
-            key = (a.get("pub_date", ""), a.get("title", ""))
-            if key in existing:
-                continue
-            f.write(json.dumps(a, ensure_ascii=False) + "\n")
-            new_count += 1
 
-    total = len(existing) + new_count
-    print(f"  [ok] {jsonl_path} (+{new_count} new, {total} total)")
-    return jsonl_path
+def append_dataset(articles, date_str):
+    """Append today's articles to cumulative JSONL dataset. Idempotent.
+
+    Dedup goes through a sidecar index of 8-byte key hashes
+    (scored-articles.idx) so a daily run reads ~8 bytes per known article
+    instead of re-parsing the whole JSONL; the index is rebuilt from the
+    JSONL ground truth whenever it's missing or damaged."""
+    datasets_dir = os.path.join(HARVEST_DIR, "datasets")
+    os.makedirs(datasets_dir, exist_ok=True)
+    jsonl_path = os.path.join(datasets_dir, "scored-articles.jsonl")
+    idx_path = os.path.join(datasets_dir, "scored-articles.idx")
+
+    existing = load_dedup_index(idx_path, jsonl_path)
+    prior = len(existing)
+
+    # Collect new articles (already score-sorted from main()), then flush
+    # each file with a single joined write — one append syscall for the
+    # JSONL and one for the index instead of a write per line
+    new_articles = []
+    new_hashes = []
+    for a in articles:
+        h = dedup_key_hash(a.get("pub_date", ""), a.get("title", ""))
+        if h in existing:
+            continue
+        existing.add(h)
+        new_articles.append(a)
+        new_hashes.append(h)
+    if new_articles:
+        lines = "".join(json_dumps(public_fields(a)) + "\n" for a in new_articles)
+        with open(jsonl_path, "ab") as f:
+            f.write(lines.encode("utf-8"))
+        with open(idx_path, "ab") as f:
+            f.write(b"".join(new_hashes))
+
+    total = prior + len(new_articles)
+    print(f"  [ok] {jsonl_path} (+{len(new_articles)} new, {total} total)")
+    return jsonl_path, new_articles
+
+
+@lru_cache(maxsize=512)
+def _parse_ymd(s):
+    """Parse a YYYY-MM-DD string. ~20x faster than strptime, cached per value."""
+    y, m, d = s.split("-")
+    return datetime(int(y), int(m), int(d))
+
+
+@lru_cache(maxsize=512)
+def _rfc822_midnight(s):
+    """YYYY-MM-DD → RFC 822 midnight timestamp, cached per unique date."""
+    return _parse_ymd(s).strftime("%a, %d %b %Y 00:00:00 GMT")
+
+
+# Escape table for HTML embedded inside element text — one C-level translate
+# pass instead of saxutils.escape's three chained .replace() calls
+_XML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
 
 
 def generate_rss(articles, date_str):
@@ -380,119 +652,115 @@ def generate_rss(articles, date_str):
     os.makedirs(feeds_dir, exist_ok=True)
     rss_path = os.path.join(feeds_dir, "rss.xml")
 
-    # Load existing items from old RSS (if any)
+    fallback_rfc822 = _rfc822_midnight(date_str)
+
+    # Load existing items from old RSS (if any) as elements — no DOTALL
+    # regex re-scan of the whole feed
     old_items = []
     if os.path.exists(rss_path):
-        with open(rss_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        # Extract existing <item> blocks
-        old_items = re.findall(r"<item>.*?</item>", content, re.DOTALL)
-
-    # Build new items from today's high-quality articles
+        try:
+            old_items = ET.parse(rss_path).getroot().findall("./channel/item")
+        except ET.ParseError:
+            old_items = []
+    # Backfill missing/empty pubDate on carried-over items (replaces the old
+    # <pubDate></pubDate> string-replace hack)
+    for item in old_items:
+        pd = item.find("pubDate")
+        if pd is None:
+            pd = ET.SubElement(item, "pubDate")
+        if not (pd.text or "").strip():
+            pd.text = fallback_rfc822
+
+    # Build new items from today's high-quality articles (filter preserves
+    # the score-desc order established in main())
     quality = [a for a in articles if a["verdict"] in ("must_read", "worth_reading")]
-    quality.sort(key=lambda x: x["score"], reverse=True)
 
     new_items = []
     for a in quality:
         desc = a.get("summary", "")
         if a.get("highlights"):
             hl_list = "".join(
-                "<li>{}</li>".format(xml_escape(h)) for h in a["highlights"]
+                "<li>{}</li>".format(h.translate(_XML_ESC)) for h in a["highlights"]
             )
             desc += "<ul>{}</ul>".format(hl_list)
 
         # Format pubDate as RFC 822 (fallback to harvest date if empty/invalid)
         pub_date_str = a.get("pub_date", "") or ""
         try:
-            dt = datetime.strptime(pub_date_str, "%Y-%m-%d")
-            rfc822_date = dt.strftime("%a, %d %b %Y 00:00:00 GMT")
+            rfc822_date = _rfc822_midnight(pub_date_str)
         except ValueError:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            rfc822_date = dt.strftime("%a, %d %b %Y 00:00:00 GMT")
-
-        item = (
-            "<item>\n"
-            "  <title>{title}</title>\n"
-            "  <link>{link}</link>\n"
-            "  <description><![CDATA[{desc}]]></description>\n"
-            "  <category>{cat}</category>\n"
-            "  <pubDate>{date}</pubDate>\n"
-            "  <source url=\"{link}\">{source}</source>\n"
-            "</item>"
-        ).format(
-            title=xml_escape(a.get("title", "")),
-            link=xml_escape(a.get("link", "")),
-            desc=desc,
-            cat=xml_escape(a.get("category", "")),
-            date=rfc822_date,
-            source=xml_escape(a.get("source", "")),
-        )
+            rfc822_date = fallback_rfc822
+
+        item = ET.Element("item")
+        ET.SubElement(item, "title").text = a.get("title", "")
+        ET.SubElement(item, "link").text = a.get("link", "")
+        # Serializer escapes the embedded HTML; readers unescape it back
+        ET.SubElement(item, "description").text = desc
+        ET.SubElement(item, "category").text = a.get("category", "")
+        ET.SubElement(item, "pubDate").text = rfc822_date
+        source = ET.SubElement(item, "source", url=a.get("link", ""))
+        source.text = a.get("source", "")
         new_items.append(item)
 
-    # Fix empty pubDate in old items (backfill with harvest date)
-    fallback_rfc822 = datetime.strptime(date_str, "%Y-%m-%d").strftime(
-        "%a, %d %b %Y 00:00:00 GMT"
-    )
-    fixed_old = []
-    for item in old_items:
-        if "<pubDate></pubDate>" in item:
-            item = item.replace(
-                "<pubDate></pubDate>",
-                "<pubDate>{}</pubDate>".format(fallback_rfc822),
-            )
-        fixed_old.append(item)
-
     # Merge: new items first, then old (dedup by link)
     seen_links = set()
     merged = []
-    for item in new_items + fixed_old:
-        link_match = re.search(r"<link>(.*?)</link>", item)
-        if link_match:
-            link = link_match.group(1)
+    for item in new_items + old_items:
+        link = item.findtext("link")
+        if link:
             if link in seen_links:
                 continue
             seen_links.add(link)
         merged.append(item)
     merged = merged[:50]  # Rolling window
 
-    items_xml = "\n".join(merged)
-    rss_xml = (
-        '<?xml version="1.0" encoding="UTF-8"?>\n'
-        '<rss version="2.0">\n'
-        "<channel>\n"
-        "  <title>AI Daily Harvest</title>\n"
-        "  <link>https://github.com/makinotes/ai-daily-feed</link>\n"
-        "  <description>Daily AI learning feed. 40+ sources scored and structured.</description>\n"
-        "  <language>zh-cn</language>\n"
-        "  <lastBuildDate>{date}</lastBuildDate>\n"
-        "{items}\n"
-        "</channel>\n"
-        "</rss>"
-    ).format(
-        date=datetime.strptime(date_str, "%Y-%m-%d").strftime("%a, %d %b %Y %H:%M:%S GMT"),
-        items=items_xml,
+    rss = ET.Element("rss", version="2.0")
+    channel = ET.SubElement(rss, "channel")
+    ET.SubElement(channel, "title").text = "AI Daily Harvest"
+    ET.SubElement(channel, "link").text = "https://github.com/makinotes/ai-daily-feed"
+    ET.SubElement(channel, "description").text = (
+        "Daily AI learning feed. 40+ sources scored and structured."
+    )
+    ET.SubElement(channel, "language").text = "zh-cn"
+    ET.SubElement(channel, "lastBuildDate").text = _parse_ymd(date_str).strftime(
+        "%a, %d %b %Y %H:%M:%S GMT"
     )
+    channel.extend(merged)
 
+    ET.indent(rss)
     with open(rss_path, "w", encoding="utf-8") as f:
-        f.write(rss_xml)
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write(ET.tostring(rss, encoding="unicode"))
     print(f"  [ok] {rss_path} ({len(merged)} items)")
     return rss_path
 
 
+# Matches daily api file names like 2026-03-15.json
+_API_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})\.json$")
+
+
 def load_recent_data(days=30):
-    """Load articles from recent api/*.json files."""
+    """Load articles from recent api/*.json files in one directory walk.
+
+    Returns {date_str: [articles]} so callers can slice sub-windows (e.g.
+    the 7-day trending window out of the 30-day load) without re-reading
+    and re-parsing the overlapping files."""
     data_dir = os.path.join(HARVEST_DIR, "api")
-    all_articles = []
     today = datetime.now()
-    for i in range(days):
-        d = today - timedelta(days=i)
-        path = os.path.join(data_dir, f"{d.strftime('%Y-%m-%d')}.json")
-        if not os.path.exists(path):
-            continue
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        all_articles.extend(data.get("articles", []))
-    return all_articles
+    first = (today - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    last = today.strftime("%Y-%m-%d")
+    by_date = {}
+    with os.scandir(data_dir) as it:
+        for entry in it:
+            m = _API_DATE_RE.match(entry.name)
+            if not m:
+                continue
+            d = m.group(1)
+            if not first <= d <= last:
+                continue
+            with open(entry.path, "rb") as f:
+                by_date[d] = json_loads(f.read()).get("articles", [])
+    return by_date
 
 
 # English stop words for trending analysis
@@ -515,18 +783,20 @@ _CN_STOP = {
 }
 
 
+# Compiled once — skips the re cache lookup per call in the trending loop
+_EN_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9]+")
+
+
 def extract_keywords(title):
     """Extract keywords from a title. Uses known terms + English proper nouns."""
     words = set()
     # English words (3+ chars, lowered) — keep original case for proper nouns
-    for w in re.findall(r"[A-Za-z][A-Za-z0-9]+", title):
+    for w in _EN_WORD_RE.findall(title):
         w_lower = w.lower()
         if len(w_lower) >= 3 and w_lower not in _STOP_WORDS:
             words.add(w if w[0].isupper() or w.isupper() else w_lower)
-    # Chinese: match known compound terms (3+ chars) from title
-    for term in _CN_KNOWN_TERMS:
-        if term in title:
-            words.add(term)
+    # Chinese: match known compound terms in one scan (see _CN_TERM_RE)
+    words.update(_CN_TERM_RE.findall(title))
     return words
 
 
@@ -546,18 +816,35 @@ _CN_KNOWN_TERMS = {
     "安全", "隐私", "版权", "监管",
 }
 
+# Single O(|title|) scan over all known terms, replacing the per-term
+# substring loop. The lookahead keeps overlapping hits (智能体 inside
+# 多智能体) so results match the old `term in title` checks; longest-first
+# ordering guards against one term shadowing a same-start longer one.
+_CN_TERM_RE = re.compile(
+    "(?=({}))".format(
+        "|".join(map(re.escape, sorted(_CN_KNOWN_TERMS, key=len, reverse=True)))
+    )
+)
+
 
 def update_indexes(date_str):
     """Generate by-category.json and trending.json from recent data."""
     indexes_dir = os.path.join(HARVEST_DIR, "indexes")
     os.makedirs(indexes_dir, exist_ok=True)
 
+    # Read each api file at most once; the 7-day trending window is a slice
+    # of the same 30-day load.
+    by_date = load_recent_data(30)
+
     # --- by-category.json (30 days, score >= 75) ---
-    articles_30d = load_recent_data(30)
+    # One global score-desc sort of the qualifying articles; bucketing then
+    # preserves that order, so the old per-category sorts disappear.
+    articles_30d = [a for articles in by_date.values() for a in articles]
+    quality_30d = [a for a in articles_30d if a.get("score", 0) >= 75]
+    quality_30d.sort(key=itemgetter("score"), reverse=True)
+
     categories = {}
-    for a in articles_30d:
-        if a.get("score", 0) < 75:
-            continue
+    for a in quality_30d:
         cat = a.get("category", "Other")
         if cat not in categories:
             categories[cat] = []
@@ -571,35 +858,35 @@ def update_indexes(date_str):
             "why_matters": a.get("why_matters", ""),
         })
 
-    # Sort each category by score desc
-    for cat in categories:
-        categories[cat].sort(key=lambda x: x["score"], reverse=True)
-
     cat_output = {"updated": date_str, "categories": categories}
     cat_path = os.path.join(indexes_dir, "by-category.json")
-    with open(cat_path, "w", encoding="utf-8") as f:
-        json.dump(cat_output, f, ensure_ascii=False, indent=2)
+    write_json(cat_output, cat_path)
 
     total_indexed = sum(len(v) for v in categories.values())
     print(f"  [ok] {cat_path} ({len(categories)} categories, {total_indexed} articles)")
 
     # --- trending.json (7-day keyword frequency) ---
-    articles_7d = load_recent_data(7)
-    quality_7d = [a for a in articles_7d if a.get("score", 0) >= 70]
+    first_7d = (datetime.now() - timedelta(days=6)).strftime("%Y-%m-%d")
+    quality_7d = [
+        a
+        for d, articles in by_date.items()
+        if d >= first_7d
+        for a in articles
+        if a.get("score", 0) >= 70
+    ]
 
-    keyword_counts = {}
+    keyword_counts = Counter()
     for a in quality_7d:
-        for kw in extract_keywords(a.get("title", "")):
-            keyword_counts[kw] = keyword_counts.get(kw, 0) + 1
+        keyword_counts.update(extract_keywords(a.get("title", "")))
 
-    # Sort by count, take top 20
-    sorted_kw = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)
-    # Filter: at least 2 mentions
+    # Top 20 by count — O(n log 20) heap selection instead of a full sort.
+    # cnt >= 2 filtering after the fact is safe: any singleton pulled into
+    # the top 20 would only have displaced other singletons.
     trending_list = [
         {"keyword": kw, "count": cnt}
-        for kw, cnt in sorted_kw
+        for kw, cnt in heapq.nlargest(20, keyword_counts.items(), key=itemgetter(1))
         if cnt >= 2
-    ][:20]
+    ]
 
     trending_output = {
         "updated": date_str,
@@ -608,65 +895,128 @@ def update_indexes(date_str):
         "trending": trending_list,
     }
     trending_path = os.path.join(indexes_dir, "trending.json")
-    with open(trending_path, "w", encoding="utf-8") as f:
-        json.dump(trending_output, f, ensure_ascii=False, indent=2)
+    write_json(trending_output, trending_path)
     print(f"  [ok] {trending_path} ({len(trending_list)} keywords)")
 
 
-def generate_csv(jsonl_path):
-    """Regenerate CSV from JSONL for Excel users. Full rebuild each time."""
+_CSV_FIELDS = (
+    "date", "title", "source", "channel", "category",
+    "score", "verdict", "level", "summary", "why_matters",
+    "highlights", "core_point", "link",
+)
+
+
+def _csv_row(a):
+    """Map one article dict onto the _CSV_FIELDS column order."""
+    return (
+        a.get("pub_date", ""),
+        a.get("title", ""),
+        a.get("source", ""),
+        a.get("source_channel", ""),
+        a.get("category", ""),
+        a.get("score", 0),
+        a.get("verdict", ""),
+        a.get("level", ""),
+        a.get("summary", ""),
+        a.get("why_matters", ""),
+        " | ".join(a.get("highlights", [])),
+        a.get("core_point", ""),
+        a.get("link", ""),
+    )
+
+
+def generate_csv(jsonl_path, new_articles=None, full_rebuild=False):
+    """Keep the CSV mirror of the JSONL for Excel users.
+
+    Daily runs append just today's new rows — the cumulative file only ever
+    grows, so re-parsing and rewriting all of it each day is wasted work.
+    The date-sorted full rebuild still happens when the CSV is missing, when
+    the new rows aren't known, or on demand via --rebuild-csv.
+    """
     csv_path = jsonl_path.replace(".jsonl", ".csv")
-    fieldnames = [
-        "date", "title", "source", "channel", "category",
-        "score", "verdict", "level", "summary", "why_matters",
-        "highlights", "core_point", "link",
-    ]
 
-    rows = []
+    if not full_rebuild and new_articles is not None and os.path.exists(csv_path):
+        # Plain utf-8 here: the utf-8-sig codec would emit a second BOM
+        # mid-file when appending
+        with open(csv_path, "a", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerows(_csv_row(a) for a in new_articles)
+        print(f"  [ok] {csv_path} (+{len(new_articles)} rows)")
+        return
+
+    # Lean (date, score, raw) entries: sorting only touches the two key
+    # fields and the row tuples are produced lazily at write time, so the
+    # rebuild never holds a second dict per article.
+    entries = []
     with open(jsonl_path, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                a = json.loads(line)
-            except json.JSONDecodeError:
+                a = json_loads(line)
+            except ValueError:
                 continue
-            rows.append({
-                "date": a.get("pub_date", ""),
-                "title": a.get("title", ""),
-                "source": a.get("source", ""),
-                "channel": a.get("source_channel", ""),
-                "category": a.get("category", ""),
-                "score": a.get("score", 0),
-                "verdict": a.get("verdict", ""),
-                "level": a.get("level", ""),
-                "summary": a.get("summary", ""),
-                "why_matters": a.get("why_matters", ""),
-                "highlights": " | ".join(a.get("highlights", [])),
-                "core_point": a.get("core_point", ""),
-                "link": a.get("link", ""),
-            })
+            entries.append((a.get("pub_date", ""), a.get("score", 0), a))
 
     # Sort by date desc, then score desc for human browsing
-    rows.sort(key=lambda r: (r["date"], r["score"]), reverse=True)
+    entries.sort(key=itemgetter(0, 1), reverse=True)
 
     with open(csv_path, "w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(_CSV_FIELDS)
+        writer.writerows(_csv_row(e[2]) for e in entries)
+
+    print(f"  [ok] {csv_path} ({len(entries)} rows)")
 
-    print(f"  [ok] {csv_path} ({len(rows)} rows)")
+
+def _read_api_meta(fpath):
+    """Parse one api/{date}.json down to its README table row (backfill path)."""
+    try:
+        with open(fpath, "rb") as f:
+            data = json_loads(f.read())
+        return {
+            "total": data.get("total", 0),
+            "must_read": data.get("verdict_counts", {}).get("must_read", 0),
+        }
+    except Exception as e:
+        print(f"  [warn] Failed to read {fpath}: {e}", file=sys.stderr)
+        return None
 
 
 def generate_folder_readmes():
     """Generate README.md for api/ and digest/ with reverse-chronological file lists."""
     # --- api/ README ---
     api_dir = os.path.join(HARVEST_DIR, "api")
-    json_files = sorted(
-        [f for f in os.listdir(api_dir) if f.endswith(".json")],
-        reverse=True,
-    )
+    with os.scandir(api_dir) as it:
+        json_files = sorted(
+            (e.name for e in it if _API_DATE_RE.match(e.name)),
+            reverse=True,
+        )
+
+    # Per-date metadata comes from the index.json sidecar kept current by
+    # generate_json; dates missing from it (pre-sidecar files) are parsed
+    # here and backfilled — in parallel, each being an independent
+    # open+parse the threads can overlap.
+    idx_path = os.path.join(api_dir, "index.json")
+    try:
+        with open(idx_path, "rb") as f:
+            idx = json_loads(f.read())
+    except (OSError, ValueError):
+        idx = {}
+
+    missing = [f for f in json_files if f.replace(".json", "") not in idx]
+    backfilled = 0
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as ex:
+            metas = ex.map(lambda f: _read_api_meta(os.path.join(api_dir, f)), missing)
+        for fname, meta in zip(missing, metas):
+            if meta is not None:
+                idx[fname.replace(".json", "")] = meta
+                backfilled += 1
+    if backfilled:
+        write_json(idx, idx_path)
+
     lines = [
         "# API Data — for Agents",
         "",
@@ -676,18 +1026,11 @@ def generate_folder_readmes():
         "|------|----------|-----------|",
     ]
     for fname in json_files:
-        fpath = os.path.join(api_dir, fname)
-        try:
-            with open(fpath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            total = data.get("total", 0)
-            must_read = data.get("verdict_counts", {}).get("must_read", 0)
-        except Exception as e:
-            print(f"  [warn] Failed to read {fpath}: {e}", file=sys.stderr)
-            total = "?"
-            must_read = "?"
         date = fname.replace(".json", "")
-        lines.append("| [{}]({}) | {} | {} |".format(date, fname, total, must_read))
+        meta = idx.get(date) or {"total": "?", "must_read": "?"}
+        lines.append(
+            "| [{}]({}) | {} | {} |".format(date, fname, meta["total"], meta["must_read"])
+        )
 
     readme_path = os.path.join(api_dir, "README.md")
     with open(readme_path, "w", encoding="utf-8") as f:
@@ -696,15 +1039,19 @@ def generate_folder_readmes():
 
     # --- digest/ README ---
     digest_dir = os.path.join(HARVEST_DIR, "digest")
-    # Collect all .md files from monthly subdirectories
+    # Collect all .md files from monthly subdirectories — scandir entries
+    # carry the dirent type, so no per-entry isdir() stat call
     all_files = []  # list of (date_str, relative_path)
-    for entry in sorted(os.listdir(digest_dir), reverse=True):
-        sub = os.path.join(digest_dir, entry)
-        if os.path.isdir(sub) and entry.startswith("20"):
-            for fname in os.listdir(sub):
-                if fname.endswith(".md"):
-                    all_files.append((fname.replace(".md", ""), f"{entry}/{fname}"))
-    all_files.sort(key=lambda x: x[0], reverse=True)
+    with os.scandir(digest_dir) as it:
+        month_dirs = [e.name for e in it if e.name.startswith("20") and e.is_dir()]
+    for entry in month_dirs:
+        with os.scandir(os.path.join(digest_dir, entry)) as it:
+            all_files.extend(
+                (e.name.replace(".md", ""), f"{entry}/{e.name}")
+                for e in it
+                if e.name.endswith(".md")
+            )
+    all_files.sort(key=itemgetter(0), reverse=True)
 
     # Group by month
     months = {}  # "2026-02" -> [(date_str, rel_path), ...]
@@ -744,74 +1091,110 @@ def main():
         idx = sys.argv.index("--date")
         if idx + 1 < len(sys.argv):
             date_str = sys.argv[idx + 1]
+    rebuild_csv = "--rebuild-csv" in sys.argv
 
     print(f"AI Daily Harvest — publishing {date_str}")
 
-    # Ensure output dirs exist
-    for subdir in ["api", "digest", "lists", "sources", "datasets", "feeds", "indexes"]:
-        os.makedirs(os.path.join(HARVEST_DIR, subdir), exist_ok=True)
-
-    # Collect articles from all channels
-    all_articles = []
-    for channel in CHANNELS:
-        raw = load_cache(channel, date_str)
-        cleaned = []
-        for a in raw:
-            if a.get("rejected"):
-                continue
-            if a.get("score", 0) < 60:
-                continue
-            cleaned.append(clean_article(a, channel))
-        print(f"  {channel}: {len(cleaned)} articles (filtered from {len(raw)})")
-        all_articles.extend(cleaned)
+    # Ensure output dirs exist — the sentinel written on the first run skips
+    # the seven stat+mkdir calls on every later run
+    layout_sentinel = os.path.join(HARVEST_DIR, ".layout_ready")
+    if not os.path.exists(layout_sentinel):
+        for subdir in ["api", "digest", "lists", "sources", "datasets", "feeds", "indexes"]:
+            os.makedirs(os.path.join(HARVEST_DIR, subdir), exist_ok=True)
+        open(layout_sentinel, "w").close()
+
+    # Re-runs for the same date (CI retries, local tweaking of the output
+    # stages) skip the parse+clean entirely via a pickle snapshot keyed on
+    # the briefing cache mtimes — if the inputs changed, the key misses.
+    pkl_path = os.path.join(HARVEST_DIR, ".cache", f"publish_{date_str}.pkl")
+    sig = tuple(_cache_mtime(channel, date_str) for channel in CHANNELS)
+    all_articles = None
+    try:
+        with open(pkl_path, "rb") as f:
+            cached_sig, cached_articles = pickle.load(f)
+        if cached_sig == sig:
+            all_articles = cached_articles
+            print(f"  [cache] {len(all_articles)} cleaned articles reused from {pkl_path}")
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    if all_articles is None:
+        # Collect articles from all channels — each channel is an independent
+        # file read + parse, so overlap them (the GIL drops during I/O and in
+        # the C parser). Print summaries after the map to keep output ordered.
+        all_articles = []
+        with ThreadPoolExecutor(max_workers=len(CHANNELS)) as ex:
+            results = list(ex.map(lambda c: ingest_channel(c, date_str), CHANNELS))
+        for channel, (cleaned, raw_count) in zip(CHANNELS, results):
+            print(f"  {channel}: {len(cleaned)} articles (filtered from {raw_count})")
+            all_articles.extend(cleaned)
+        os.makedirs(os.path.dirname(pkl_path), exist_ok=True)
+        with open(pkl_path, "wb") as f:
+            pickle.dump((sig, all_articles), f, pickle.HIGHEST_PROTOCOL)
 
     if not all_articles:
         print("  [warn] No articles found, skipping")
         sys.exit(1)
 
-    # Generate outputs — each step isolated so one failure doesn't block others
-    errors = []
+    # Sort once, score-desc. Every downstream consumer wants this order, and
+    # bucketing a sorted list keeps each bucket sorted — no per-stage re-sorts.
+    all_articles.sort(key=itemgetter("score"), reverse=True)
 
-    steps = [
-        ("api JSON", lambda: generate_json(all_articles, date_str)),
-        ("daily picks", lambda: generate_daily_picks(all_articles, date_str)),
-        ("markdown digest", lambda: generate_markdown(all_articles, date_str)),
-        ("dataset JSONL", lambda: append_dataset(all_articles, date_str)),
-    ]
+    # One fused pass: bucket by verdict and tally the counters that each
+    # output stage previously recomputed with its own walk over the articles.
+    by_verdict = {v: [] for v in VERDICT_ORDER}
+    verdict_counts = Counter()
+    source_counts = Counter()
+    for a in all_articles:
+        v = a["verdict"]
+        by_verdict[v].append(a)
+        verdict_counts[v] += 1
+        source_counts[a["source"]] += 1
+
+    # Generate outputs — each step isolated so one failure doesn't block
+    # others, and independent steps overlapped in a thread pool (they are
+    # I/O-dominated writes to disjoint paths).
+    errors = []
 
-    jsonl_path = None
-    for name, fn in steps:
+    def run_step(step):
+        name, fn = step
         try:
-            result = fn()
-            if name == "dataset JSONL":
-                jsonl_path = result
+            return fn()
         except Exception as e:
             print(f"  [ERROR] {name} failed: {e}", file=sys.stderr)
             errors.append(name)
+            return None
 
-    # Steps that depend on JSONL or are independent
-    independent_steps = [
-        ("source stats", lambda: update_source_stats(all_articles, date_str)),
+    # Phase 1 — fully independent outputs
+    phase1 = [
+        ("api JSON", lambda: generate_json(all_articles, verdict_counts, date_str)),
+        ("daily picks", lambda: generate_daily_picks(by_verdict, date_str)),
+        ("markdown digest", lambda: generate_markdown(by_verdict, verdict_counts, source_counts, date_str)),
         ("RSS feed", lambda: generate_rss(all_articles, date_str)),
+        ("dataset JSONL", lambda: append_dataset(all_articles, date_str)),
+    ]
+    with ThreadPoolExecutor(max_workers=len(phase1)) as ex:
+        results = dict(zip([n for n, _ in phase1], ex.map(run_step, phase1)))
+
+    # None → update_source_stats falls back to a full rebuild
+    jsonl_path, new_articles = results["dataset JSONL"] or (None, None)
+
+    # Phase 2 — stages that read phase-1 outputs: CSV consumes the JSONL,
+    # source stats folds in the rows append_dataset reported new, and the
+    # indexes/READMEs re-read api/*.json including today's file. All file
+    # paths are disjoint within a phase, so no locking is needed.
+    phase2 = [
+        ("source stats", lambda: update_source_stats(new_articles, date_str)),
         ("indexes", lambda: update_indexes(date_str)),
         ("folder READMEs", lambda: generate_folder_readmes()),
     ]
     if jsonl_path:
-        independent_steps.insert(1, ("CSV export", lambda: generate_csv(jsonl_path)))
-
-    for name, fn in independent_steps:
-        try:
-            fn()
-        except Exception as e:
-            print(f"  [ERROR] {name} failed: {e}", file=sys.stderr)
-            errors.append(name)
+        phase2.insert(0, ("CSV export", lambda: generate_csv(jsonl_path, new_articles, rebuild_csv)))
+    with ThreadPoolExecutor(max_workers=len(phase2)) as ex:
+        list(ex.map(run_step, phase2))
 
     # Summary
-    verdicts = {}
-    for a in all_articles:
-        v = a["verdict"]
-        verdicts[v] = verdicts.get(v, 0) + 1
-    v_summary = ", ".join(f"{v}={c}" for v, c in sorted(verdicts.items()))
+    v_summary = ", ".join(f"{v}={c}" for v, c in sorted(verdict_counts.items()))
     print(f"Done. {len(all_articles)} articles published. [{v_summary}]")
     if errors:
         print(f"  [warn] {len(errors)} step(s) failed: {', '.join(errors)}", file=sys.stderr)